@@ -7,7 +7,7 @@ from ._auth import CredentialsWithHost
 from ._buildscript import BuildscriptMetadata, BuildscriptMetadataException, buildscript
 from ._date import datetime_to_iso8601, iso8601_to_datetime
 from ._environment import EnvironmentType
-from ._fs import atomic_file_swap, safe_rmpath
+from ._fs import atomic_file_swap, atomic_replace, safe_rmpath
 from ._generic import NotSet, flatten, not_none
 from ._importlib import appending_to_sys_path, import_class
 from ._option_sets import LoggingOptions
@@ -38,6 +38,7 @@ __all__ = [
     "EnvironmentType",
     # _fs
     "atomic_file_swap",
+    "atomic_replace",
     "safe_rmpath",
     # _generic
     "flatten",
@@ -94,6 +94,26 @@ def atomic_file_swap(
                     os.remove(old.name)
 
 
+@contextlib.contextmanager
+def atomic_replace(path: "str | Path") -> Iterator[Path]:
+    """
+    Yields a temporary path next to *path* to write a file or directory to. If the with context exits without errors,
+    the temporary path is moved to *path* with :func:`os.replace`, otherwise it is removed. This way, *path* never
+    contains partially written data and concurrent readers always see either the old or the new contents.
+
+    :param path: The path to replace.
+    """
+
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        yield temp_path
+        os.replace(temp_path, path)
+    finally:
+        # Nothing is left to remove if the temporary path was moved into place.
+        safe_rmpath(temp_path)
+
+
 def safe_rmpath(path: Path) -> None:
     """
     Removes the specified *path* from the file system. If it is a directory, :func:`shutil.rmtree` will be used
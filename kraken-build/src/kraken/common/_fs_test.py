@@ -0,0 +1,26 @@
+from pathlib import Path
+
+import pytest
+
+from kraken.common._fs import atomic_replace
+
+
+def test__atomic_replace__replaces_file_on_success(tmp_path: Path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_text("old")
+    with atomic_replace(path) as temp_path:
+        temp_path.write_text("new")
+        assert path.read_text() == "old"
+    assert path.read_text() == "new"
+    assert [p.name for p in tmp_path.iterdir()] == ["file.txt"]
+
+
+def test__atomic_replace__removes_temporary_path_on_error(tmp_path: Path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_text("old")
+    with pytest.raises(RuntimeError), atomic_replace(path) as temp_path:
+        temp_path.mkdir()
+        (temp_path / "partial").write_text("partial")
+        raise RuntimeError
+    assert path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["file.txt"]
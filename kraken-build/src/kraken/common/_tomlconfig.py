@@ -40,4 +40,5 @@ class TomlConfigFile(MutableMapping[str, Any]):
 
     def save(self) -> None:
         self.path.parent.mkdir(exist_ok=True, parents=True)
-        self.path.write_text(tomli_w.dumps(self._get_data()))
+        with self.path.open("wb") as fp:
+            tomli_w.dump(self._get_data(), fp)
@@ -2,21 +2,62 @@ from __future__ import annotations
 
 import dataclasses
 import enum
+import functools
+import os
 import re
 import subprocess as sp
 from pathlib import Path
 
 
+def is_git_worktree(path: Path | None) -> bool:
+    """Returns #True if the given directory (or the current working directory) is located inside a Git worktree.
+
+    This only looks for a `.git` directory or file (as used for worktrees and submodules) in the directory and its
+    parents, which is a lot cheaper than spawning `git` only to find out that there is no repository. If the
+    `GIT_DIR` environment variable is set, we can't tell without asking Git and always return #True.
+    """
+
+    if "GIT_DIR" in os.environ:
+        return True
+    path = (path or Path.cwd()).absolute()
+    return any((directory / ".git").exists() for directory in (path, *path.parents))
+
+
 def git_describe(path: Path | None, tags: bool = True, dirty: bool = True) -> str:
     """Describe a repository with tags.
 
     :param path: The directory in which to describe.
     :param tags: Whether to include tags (adds the `--tags` flag).
     :param dirty: Whether to include if the directory tree is dirty (adds the `--dirty` flag).
-    :raise ValueError: If `git describe` failed.
+    :raise ValueError: If `git describe` failed, or if *path* is not inside a Git repository.
     :return: The Git head description.
     """
 
+    # Avoid spawning any subprocesses for projects that are not versioned with Git (e.g. vendored source trees).
+    if not is_git_worktree(path):
+        raise ValueError(f"not a Git repository: {path or Path.cwd()}")
+
+    # The `-dirty` suffix depends on the state of the worktree, which can change at the same commit, so we can not
+    # cache it and describe the repository directly.
+    if dirty:
+        return _git_describe(path, tags, dirty)
+
+    # Projects in a monorepo share the same repository, so we only need to describe it once per commit.
+    output = sp.check_output(["git", "rev-parse", "--show-toplevel", "HEAD"], cwd=path).decode()
+    toplevel, head_sha = output.splitlines()
+    return _git_describe_cached(Path(toplevel), head_sha, tags)
+
+
+@functools.lru_cache(maxsize=64)
+def _git_describe_cached(toplevel: Path, head_sha: str, tags: bool) -> str:
+    """Cached variant of #_git_describe() without the `--dirty` flag. The *head_sha* is only part of the cache key."""
+
+    return _git_describe(toplevel, tags, dirty=False)
+
+
+def _git_describe(path: Path | None, tags: bool, dirty: bool) -> str:
+    """Implementation of #git_describe()."""
+
     command = ["git", "describe"]
     if tags:
         command.append("--tags")
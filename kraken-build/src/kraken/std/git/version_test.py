@@ -0,0 +1,88 @@
+import subprocess as sp
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from kraken.std.git.version import _git_describe_cached, git_describe, is_git_worktree
+
+
+def test__is_git_worktree__finds_dot_git_in_parent_directory(tmp_path: Path) -> None:
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "sub" / "dir").mkdir(parents=True)
+    assert is_git_worktree(tmp_path / "sub" / "dir")
+
+
+def test__git_describe__raises_ValueError_outside_of_git_repository(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    assert not is_git_worktree(tmp_path)
+    with pytest.raises(ValueError):
+        git_describe(tmp_path)
+
+
+def test__git_describe__is_cached_per_commit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    (tmp_path / "sub").mkdir()
+
+    def git(*args: str) -> None:
+        sp.check_call(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args], cwd=tmp_path)
+
+    git("init", "-q")
+    git("commit", "-q", "--allow-empty", "-m", "initial commit")
+    git("tag", "1.0.0")
+
+    hits = _git_describe_cached.cache_info().hits
+    assert git_describe(tmp_path, dirty=False) == "1.0.0"
+    assert git_describe(tmp_path / "sub", dirty=False) == "1.0.0"
+    assert _git_describe_cached.cache_info().hits == hits + 1
+
+    git("commit", "-q", "--allow-empty", "-m", "second commit")
+    assert git_describe(tmp_path, dirty=False).startswith("1.0.0-1-g")
+
+
+def test__git_describe__reflects_worktree_changes_at_the_same_commit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GIT_DIR", raising=False)
+
+    def git(*args: str) -> None:
+        sp.check_call(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args], cwd=tmp_path)
+
+    (tmp_path / "file.txt").write_text("a")
+    git("init", "-q")
+    git("add", "file.txt")
+    git("commit", "-q", "-m", "initial commit")
+    git("tag", "1.0.0")
+
+    assert git_describe(tmp_path) == "1.0.0"
+    (tmp_path / "file.txt").write_text("b")
+    assert git_describe(tmp_path) == "1.0.0-dirty"
+    (tmp_path / "file.txt").write_text("a")
+    assert git_describe(tmp_path) == "1.0.0"
+
+
+def test__git_describe__spawns_a_single_subprocess_with_default_arguments(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GIT_DIR", raising=False)
+
+    def git(*args: str) -> None:
+        sp.check_call(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args], cwd=tmp_path)
+
+    git("init", "-q")
+    git("commit", "-q", "--allow-empty", "-m", "initial commit")
+    git("tag", "1.0.0")
+
+    calls: list[list[str]] = []
+    check_output = sp.check_output
+
+    def counting_check_output(command: list[str], **kwargs: Any) -> Any:
+        calls.append(command)
+        return check_output(command, **kwargs)
+
+    monkeypatch.setattr(sp, "check_output", counting_check_output)
+    for _ in range(3):
+        assert git_describe(tmp_path) == "1.0.0"
+    assert calls == [["git", "describe", "--tags", "--dirty"]] * 3
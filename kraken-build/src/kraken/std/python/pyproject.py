@@ -116,6 +116,14 @@ class PyprojectHandler(ABC):
     def __init__(self, raw: Pyproject) -> None:
         self.raw = raw
 
+    def _get_project_value(self, key: str) -> Any:
+        """
+        Returns a value from the `project` section of the Pyproject.toml file, or #None if either does not exist.
+        """
+
+        project = self.raw.get("project")
+        return None if project is None else project.get(key)
+
     def get_name(self) -> str | None:
         """
         Returns the current project name.
@@ -125,7 +133,7 @@ class PyprojectHandler(ABC):
         [1]: https://peps.python.org/pep-0621/#name
         """
 
-        return self.raw.get("project", {}).get("name")  # type: ignore[no-any-return]
+        return self._get_project_value("name")  # type: ignore[no-any-return]
 
     def get_python_version_constraint(self) -> str | None:
         """
@@ -137,7 +145,7 @@ class PyprojectHandler(ABC):
         [1]: https://peps.python.org/pep-0621/#requires-python
         """
 
-        return self.raw.get("project", {}).get("requires-python")  # type: ignore[no-any-return]
+        return self._get_project_value("requires-python")  # type: ignore[no-any-return]
 
     def get_version(self) -> str | None:
         """
@@ -148,7 +156,7 @@ class PyprojectHandler(ABC):
         [1]: https://peps.python.org/pep-0621/#version
         """
 
-        return self.raw.get("project", {}).get("version")  # type: ignore[no-any-return]
+        return self._get_project_value("version")  # type: ignore[no-any-return]
 
     def set_version(self, version: str | None) -> None:
         """
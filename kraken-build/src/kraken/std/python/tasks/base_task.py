@@ -5,18 +5,59 @@ import os
 import shutil
 import subprocess as sp
 import sys
-from collections.abc import Iterable, MutableMapping
+from collections.abc import Iterable, Mapping, MutableMapping
+from pathlib import Path
+from weakref import WeakKeyDictionary
 
 from deprecated import deprecated
 
 from kraken.common.pyenv import VirtualEnvInfo, get_current_venv
 from kraken.core import Project, Task, TaskRelationship, TaskStatus
-from kraken.std.python.buildsystem import ManagedEnvironment
+from kraken.std.python.buildsystem import ManagedEnvironment, PythonBuildSystem
 
 from ..settings import python_settings
 
 logger = logging.getLogger(__name__)
 
+#: Managed environments that are known to exist, per build system. Determining the path of a managed environment
+#: may require running a subprocess (e.g. `poetry env info -p`), which we don't want to repeat for every task.
+_managed_environments: WeakKeyDictionary[PythonBuildSystem, ManagedEnvironment] = WeakKeyDictionary()
+
+#: Cache for #_which(). We only cache programs that were found, as they may be installed later in the build. The
+#: cache outlives a single build, so a cached path is only used while it still exists (e.g. the venv could be deleted).
+_which_cache: dict[tuple[str, str | None], str] = {}
+
+
+def _get_managed_environment(build_system: PythonBuildSystem) -> ManagedEnvironment:
+    venv = _managed_environments.get(build_system)
+    if venv is None:
+        venv = build_system.get_managed_environment()
+        # Don't cache an environment that does not exist yet, as the `python.install` task may still create it.
+        if venv.exists():
+            _managed_environments[build_system] = venv
+    return venv
+
+
+def _resolve_program(program: str, path: str | None, cwd: Path) -> str | None:
+    """Resolve *program* like the subprocess that runs it in *cwd* would. Programs with a path separator are relative
+    to *cwd* (and not to the current working directory), all others are looked up in the *path*."""
+
+    if os.path.dirname(program):
+        return shutil.which(os.path.join(cwd, program), path=path)
+    return _which(program, path)
+
+
+def _which(program: str, path: str | None) -> str | None:
+    key = (program, path)
+    result = _which_cache.get(key)
+    if result is None or not os.path.isfile(result):
+        result = shutil.which(program, path=path)
+        if result is not None:
+            _which_cache[key] = result
+        else:
+            _which_cache.pop(key, None)
+    return result
+
 
 class EnvironmentAwareDispatchTask(Task):
     """Base class for tasks that run a subcommand. The command ensures that the command is aware of the
@@ -30,10 +71,10 @@ class EnvironmentAwareDispatchTask(Task):
         self.settings = python_settings(project)
 
     def get_relationships(self) -> Iterable[TaskRelationship]:
-        from .install_task import InstallTask
+        from .install_task import get_install_tasks
 
         # If a python.install task exists, we may need it.
-        for task in (t for t in self.project.tasks().values() if isinstance(t, InstallTask)):
+        for task in get_install_tasks(self.project):
             yield TaskRelationship(task, True, False)
 
         yield from super().get_relationships()
@@ -60,24 +101,38 @@ class EnvironmentAwareDispatchTask(Task):
         elif active_venv:
             logger.info("An active virtual environment was found, not activating managed environment")
 
+    def activate_environment(self, environ: MutableMapping[str, str]) -> None:
+        """Activates the managed environment of the project's build system in *environ*, if it supports one."""
+
+        if self.settings.build_system and self.settings.build_system.supports_managed_environments():
+            self.activate_managed_environment(_get_managed_environment(self.settings.build_system), environ)
+
+    def resolve_program(self, program: str, environ: Mapping[str, str]) -> str | None:
+        """Resolves *program* like a subprocess with the given *environ* in the project directory would."""
+
+        return _resolve_program(program, environ.get("PATH"), self.project.directory)
+
     def execute(self) -> TaskStatus:
         env = os.environ.copy()
-        try:
+        if type(self).get_execute_command_v2 is not EnvironmentAwareDispatchTask.get_execute_command_v2:
             command = self.get_execute_command_v2(env)
-        except NotImplementedError:
+        else:
             command = self.get_execute_command()
         if isinstance(command, TaskStatus):
             return command
-        if self.settings.build_system and self.settings.build_system.supports_managed_environments():
-            self.activate_managed_environment(self.settings.build_system.get_managed_environment(), env)
-        if self.python_dependencies and shutil.which(command[0], path=env.get("PATH")) is None:
+        self.activate_environment(env)
+        program = self.resolve_program(command[0], env)
+        if self.python_dependencies and program is None:
             logger.warning("Some Python dependencies of %s are not installed.", self.name)
             logger.warning("To run this task successfully you should add to the `pyproject.toml` file:")
             logger.warning("[tool.poetry.dev-dependencies]")
             for dep in self.python_dependencies:
                 logger.warning('%s = "*"', dep)
             return TaskStatus.failed("The %s dependencies are missing" % self.python_dependencies)
+        if program is not None:
+            # Pass the resolved program, as Windows would otherwise not find it in the PATH of the *env*.
+            command = [program, *command[1:]]
         logger.info("%s", command)
-        shell = sys.platform.startswith("win32")  # Windows requires shell to find executable in path
+        shell = program is None and sys.platform.startswith("win32")  # Windows requires shell to find executable
         result = sp.call(command, cwd=self.project.directory, env=env, shell=shell)
         return self.handle_exit_code(result)
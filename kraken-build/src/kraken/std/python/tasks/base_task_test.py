@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from kraken.core import Project
+from kraken.std.python.tasks.base_task import EnvironmentAwareDispatchTask, _which
+from kraken.std.python.tasks.black_task import BlackTask
+from kraken.std.python.tasks.install_task import get_install_tasks, install
+
+
+def test__EnvironmentAwareDispatchTask__depends_on_install_task(kraken_project: Project) -> None:
+    task = kraken_project.task("black", BlackTask)
+    assert get_install_tasks(kraken_project) == ()
+    assert not any(rel.other_task.name == "python.install" for rel in task.get_relationships())
+
+    install_task = install(project=kraken_project)
+    assert get_install_tasks(kraken_project) == (install_task,)
+    assert any(rel.other_task is install_task and rel.strict for rel in task.get_relationships())
+
+
+def test__EnvironmentAwareDispatchTask__resolves_relative_program_in_project_directory(
+    kraken_project: Project, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tool = kraken_project.directory / "bin" / "tool"
+    tool.parent.mkdir()
+    tool.write_text(f"#!{sys.executable}\n")
+    tool.chmod(0o755)
+    monkeypatch.chdir(tmp_path)  # The program does not exist relative to the current working directory.
+
+    class ToolTask(EnvironmentAwareDispatchTask):
+        python_dependencies = ["tool"]
+
+        def get_execute_command(self) -> list[str]:
+            return ["bin/tool"]
+
+    assert kraken_project.task("tool", ToolTask).execute().is_succeeded()
+
+
+def test___which__does_not_return_cached_programs_that_no_longer_exist(tmp_path: Path) -> None:
+    tool = tmp_path / "venv" / "bin" / "tool"
+    tool.parent.mkdir(parents=True)
+    tool.write_text(f"#!{sys.executable}\n")
+    tool.chmod(0o755)
+    assert _which("tool", str(tool.parent)) == str(tool)
+
+    tool.unlink()
+    assert _which("tool", str(tool.parent)) is None
@@ -19,8 +19,8 @@ class BlackTask(EnvironmentAwareDispatchTask):
     black_bin: Property[str] = Property.default("black")
     check_only: Property[bool] = Property.default(False)
     config_file: Property[Path]
-    additional_args: Property[Sequence[str]] = Property.default_factory(list)
-    additional_files: Property[Sequence[Path]] = Property.default_factory(list)
+    additional_args: Property[Sequence[str]] = Property.default(())
+    additional_files: Property[Sequence[Path]] = Property.default(())
 
     # EnvironmentAwareDispatchTask
 
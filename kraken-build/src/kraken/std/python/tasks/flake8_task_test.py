@@ -0,0 +1,11 @@
+from kraken.core import Project
+from kraken.std.python.tasks.flake8_task import Flake8Task
+
+
+def test__Flake8Task__get_execute_command__contains_additional_args_once(kraken_project: Project) -> None:
+    task = kraken_project.task("flake8", Flake8Task)
+    task.additional_args = ["--max-line-length", "100"]
+    command = task.get_execute_command()
+    assert command.count("--max-line-length") == 1
+    assert command.count("100") == 1
+    assert command[-2:] == ["--max-line-length", "100"]
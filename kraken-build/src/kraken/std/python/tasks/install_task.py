@@ -14,11 +14,19 @@ from ..settings import python_settings
 logger = logging.getLogger(__name__)
 
 
+class _InstallTasks(list["InstallTask"]):
+    """Project metadata that keeps track of the #InstallTask#s in a project. See #get_install_tasks()."""
+
+
 class InstallTask(Task):
     build_system: Property[PythonBuildSystem | None] = Property.default(None)
     always_use_managed_env: Property[bool] = Property.default(True)
     skip_if_venv_exists: Property[bool] = Property.default(True)
 
+    def __init__(self, name: str, project: Project) -> None:
+        super().__init__(name, project)
+        project.find_metadata(_InstallTasks, _InstallTasks).append(self)
+
     # Task
 
     def get_description(self) -> str | None:
@@ -61,6 +69,12 @@ class InstallTask(Task):
         return TaskStatus.succeeded()
 
 
+def get_install_tasks(project: Project) -> tuple[InstallTask, ...]:
+    """Returns all #InstallTask#s that were created in the given project, without looking at every task in it."""
+
+    return tuple(project.find_metadata(_InstallTasks) or ())
+
+
 def install(*, name: str = "python.install", project: Project | None = None) -> InstallTask:
     """Get or create the `python.install` task for the given project.
 
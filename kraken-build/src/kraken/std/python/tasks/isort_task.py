@@ -17,7 +17,7 @@ class IsortTask(EnvironmentAwareDispatchTask):
     isort_bin: Property[str] = Property.default("isort")
     check_only: Property[bool] = Property.default(False)
     config_file: Property[Path]
-    additional_files: Property[Sequence[Path]] = Property.default_factory(list)
+    additional_files: Property[Sequence[Path]] = Property.default(())
 
     # EnvironmentAwareDispatchTask
 
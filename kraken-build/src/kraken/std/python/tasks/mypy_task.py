@@ -20,11 +20,14 @@ class MypyTask(EnvironmentAwareDispatchTask):
 
     mypy_pex_bin: Property[Path | None] = Property.default(None)
     config_file: Property[Path]
-    additional_args: Property[Sequence[str]] = Property.default_factory(list)
+    additional_args: Property[Sequence[str]] = Property.default(())
     check_tests: Property[bool] = Property.default(True)
     use_daemon: Property[bool] = Property.default(True)
     python_version: Property[str]
 
+    #: Pass `--fixed-format-cache` to Mypy, which makes incremental runs faster. Requires Mypy 1.18 or newer.
+    fixed_format_cache: Property[bool] = Property.default(False)
+
     # EnvironmentAwareDispatchTask
 
     def get_execute_command_v2(self, env: MutableMapping[str, str]) -> list[str]:
@@ -60,6 +63,8 @@ class MypyTask(EnvironmentAwareDispatchTask):
             command += ["--show-error-codes", "--namespace-packages"]  # Sane defaults. 🙏
         if self.python_version.is_filled():
             command += ["--python-version", self.python_version.get()]
+        if self.fixed_format_cache.get():
+            command += ["--fixed-format-cache"]
         source_dir = self.settings.source_directory
         command += [str(source_dir)]
         if self.check_tests.get():
@@ -86,18 +91,20 @@ def mypy(
     use_daemon: bool = True,
     python_version: str | Supplier[str] | None = None,
     version_spec: str | None = None,
+    fixed_format_cache: bool = False,
 ) -> MypyTask:
     """
     :param version_spec: If specified, the Mypy tool will be installed as a PEX and does not need to be installed
         into the Python project's virtual env.
+    :param fixed_format_cache: Use Mypy's faster binary cache format (Mypy 1.18+). When combined with
+        :param:`version_spec`, the PEX is built with the `faster-cache` extra.
     """
 
     project = project or Project.current()
 
     if version_spec is not None:
-        mypy_pex_bin = pex_build(
-            "mypy", requirements=[f"mypy{version_spec}"], console_script="mypy", project=project
-        ).output_file
+        requirement = f"mypy[faster-cache]{version_spec}" if fixed_format_cache else f"mypy{version_spec}"
+        mypy_pex_bin = pex_build("mypy", requirements=[requirement], console_script="mypy", project=project).output_file
     else:
         mypy_pex_bin = None
 
@@ -108,4 +115,5 @@ def mypy(
     task.check_tests = check_tests
     task.use_daemon = use_daemon
     task.python_version = python_version
+    task.fixed_format_cache = fixed_format_cache
     return task
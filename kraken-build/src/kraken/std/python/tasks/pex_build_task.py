@@ -1,12 +1,15 @@
+import contextlib
 import hashlib
 import logging
+import os
 import shlex
 import subprocess
 import sys
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from pathlib import Path
 from typing import Literal
 
+from kraken.common import atomic_replace
 from kraken.core.system.project import Project
 from kraken.core.system.property import Property
 from kraken.core.system.task import Task, TaskStatus
@@ -30,55 +33,128 @@ class PexBuildTask(Task):
     python: Property[Path | None] = Property.default(None)
     index_url: Property[str | None] = Property.default(None)
 
+    #: The PEX layout. A `packed` or `loose` PEX is a directory that must be run with a Python interpreter, but
+    #: it is faster to build than a `zipapp` (the default).
+    layout: Property[Literal["zipapp", "packed", "loose"] | None] = Property.default(None)
+
+    #: Whether to include pre-compiled `.pyc` files in the PEX. If not set, pex uses its default (no compilation).
+    compile_bytecode: Property[bool | None] = Property.default(None)
+
+    #: The directory for pex to keep its caches in (`PEX_ROOT`). If not set, pex uses its own default (`~/.pex`).
+    pex_root: Property[Path | None] = Property.default(None)
+
     #: The path to the built PEX file will be written to this property.
     output_file: Property[Path] = Property.output()
 
+    def __init__(self, name: str, project: Project) -> None:
+        super().__init__(name, project)
+        self._cached_output_file_path: tuple[tuple[str, ...], Path] | None = None
+
     def _get_output_file_path(self) -> Path:
-        hashsum = hashlib.md5(
-            ";".join(
-                [
-                    self.binary_name.get(),
-                    *self.requirements.get(),
-                    self.entry_point.get() or "",
-                    self.console_script.get() or "",
-                    self.interpreter_constraint.get() or "",
-                    self.venv.get() or "",
-                    self.pex_binary.map(str).get() or "",
-                    self.python.map(str).get() or "",
-                ]
-            ).encode()
-        ).hexdigest()
-        return (
+        # NOTE: The order in which requirements are specified does not affect the resolved PEX, so we normalize it
+        #       to let equivalent requirement lists share the same PEX.
+        pex_binary = self.pex_binary.get()
+        python = self.python.get()
+        compile_bytecode = self.compile_bytecode.get()
+        key = (
+            self.binary_name.get(),
+            *sorted(req.strip() for req in self.requirements.get()),
+            self.entry_point.get() or "",
+            self.console_script.get() or "",
+            self.interpreter_constraint.get() or "",
+            self.venv.get() or "",
+            str(pex_binary) if pex_binary else "",
+            str(python) if python else "",
+            self.layout.get() or "",
+            "" if compile_bytecode is None else str(compile_bytecode),
+        )
+        if self._cached_output_file_path is not None and self._cached_output_file_path[0] == key:
+            return self._cached_output_file_path[1]
+
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in key:
+            hasher.update(part.encode())
+            hasher.update(b"\x1f")
+        path = (
             self.project.context.build_directory
             / ".store"
-            / f"{hashsum}-{self.binary_name.get()}"
+            / f"{hasher.hexdigest()}-{self.binary_name.get()}"
             / self.binary_name.get()
         ).with_suffix(".pex")
+        self._cached_output_file_path = (key, path)
+        return path
 
     def prepare(self) -> TaskStatus | None:
-        self.output_file = self._get_output_file_path().absolute()
-        if self.output_file.get().exists():
-            return TaskStatus.skipped(f"PEX `{self.binary_name.get()}` already exists ({self.output_file.get()})")
+        output_file = self._get_output_file_path().absolute()
+        self.output_file = output_file
+        if _is_pex_built(output_file):
+            return TaskStatus.skipped(f"PEX `{self.binary_name.get()}` already exists ({output_file})")
         return TaskStatus.pending()
 
     def execute(self) -> TaskStatus | None:
+        output_file = self.output_file.get()
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # NOTE: The PEX store is shared by all Kraken processes that use the same build directory, so we guard the
+        #       build with a lock and write the PEX to a temporary file first. That way nobody ever sees a partially
+        #       written PEX and two builds of the same PEX don't race each other.
+        with _exclusive_lock(output_file.with_name(output_file.name + ".lock")):
+            if _is_pex_built(output_file):
+                return TaskStatus.skipped(f"PEX `{self.binary_name.get()}` already exists ({output_file})")
+
+            self.logger.info("Building PEX `%s` (%s)", self.binary_name.get(), output_file)
+            try:
+                with atomic_replace(output_file) as temp_file:
+                    _build_pex(
+                        output_file=temp_file,
+                        requirements=self.requirements.get(),
+                        entry_point=self.entry_point.get(),
+                        console_script=self.console_script.get(),
+                        interpreter_constraint=self.interpreter_constraint.get(),
+                        venv=self.venv.get(),
+                        pex_binary=self.pex_binary.get(),
+                        python=self.python.get(),
+                        index_url=self.index_url.get() or _get_default_index_url(self.project),
+                        pex_root=self.pex_root.get(),
+                        layout=self.layout.get(),
+                        compile_bytecode=self.compile_bytecode.get(),
+                    )
+            except subprocess.CalledProcessError as exc:
+                return TaskStatus.failed(
+                    f"PEX `{self.binary_name.get()}` could not be built ({output_file}), "
+                    f"pex returned exit code {exc.returncode}"
+                )
+
+        return TaskStatus.succeeded(f"PEX `{self.binary_name.get()}` built successfully ({output_file})")
+
+
+def _is_pex_built(output_file: Path) -> bool:
+    """Returns `True` if *output_file* exists and is not empty. An empty file is left behind if an older version of
+    this task got interrupted while building the PEX, and must be rebuilt."""
+
+    try:
+        return os.stat(output_file).st_size > 0
+    except FileNotFoundError:
+        return False
+
+
+@contextlib.contextmanager
+def _exclusive_lock(lock_file: Path) -> Iterator[None]:
+    """Hold an exclusive inter-process lock on *lock_file* for the duration of the context. This is a no-op on
+    platforms without :mod:`fcntl` (i.e. Windows)."""
+
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+
+    with lock_file.open("a") as fp:
+        fcntl.flock(fp, fcntl.LOCK_EX)
         try:
-            self.output_file.get().parent.mkdir(parents=True, exist_ok=True)
-            _build_pex(
-                output_file=self.output_file.get(),
-                requirements=self.requirements.get(),
-                entry_point=self.entry_point.get(),
-                console_script=self.console_script.get(),
-                interpreter_constraint=self.interpreter_constraint.get(),
-                venv=self.venv.get(),
-                pex_binary=self.pex_binary.get(),
-                python=self.python.get(),
-                index_url=self.index_url.get() or _get_default_index_url(self.project),
-            )
-        except subprocess.CalledProcessError as exc:
-            return TaskStatus.from_exit_code(exc.cmd, exc.returncode)
-
-        return TaskStatus.succeeded(f"PEX `{self.binary_name.get()}` built successfully ({self.output_file.get()})")
+            yield
+        finally:
+            fcntl.flock(fp, fcntl.LOCK_UN)
 
 
 def _build_pex(
@@ -93,6 +169,9 @@ def _build_pex(
     pex_binary: Path | None = None,
     python: Path | None = None,
     index_url: str | None = None,
+    pex_root: Path | None = None,
+    layout: Literal["zipapp", "packed", "loose"] | None = None,
+    compile_bytecode: bool | None = None,
     log: logging.Logger | None = None,
 ) -> None:
     """Invokes the `pex` CLI to build a PEX file and write it to :param:`output_file`.
@@ -105,6 +184,9 @@ def _build_pex(
     :param pex_binary: Path to the `pex` binary to execute. If not specified, `python -m pex` will be used
         taking into account the :param:`python` parameter.
     :param python: The Python executable to run `python -m pex` with. If not set, defaults to :data:`sys.executable`.
+    :param pex_root: The directory for pex to keep its caches in. If not set, pex uses its default (`~/.pex`).
+    :param layout: The PEX layout. If not set, pex builds a `zipapp`.
+    :param compile_bytecode: Whether to pre-compile `.pyc` files into the PEX. If not set, pex uses its default.
     """
 
     if pex_binary is not None:
@@ -129,6 +211,10 @@ def _build_pex(
         command += ["--interpreter-constraint", interpreter_constraint]
     if venv is not None:
         command += ["--venv", venv]
+    if layout is not None:
+        command += ["--layout", layout]
+    if compile_bytecode is not None:
+        command += ["--compile" if compile_bytecode else "--no-compile"]
     for key, value in (inject_env or {}).items():
         command += ["--inject-env", f"{key}={value}"]
 
@@ -137,8 +223,11 @@ def _build_pex(
         command += ["--index-url", index_url]
         safe_command += ["--index-url", redact_url_password(index_url)]
 
-    (log or logging).info("Building PEX $ %s", " ".join(map(shlex.quote, safe_command)))
-    subprocess.run(command, check=True)
+    log = log or logger
+    if log.isEnabledFor(logging.INFO):
+        log.info("Building PEX $ %s", shlex.join(safe_command))
+    env = None if pex_root is None else {**os.environ, "PEX_ROOT": str(pex_root)}
+    subprocess.run(command, check=True, stdin=subprocess.DEVNULL, env=env)
 
 
 def pex_build(
@@ -150,6 +239,9 @@ def pex_build(
     interpreter_constraint: str | None = None,
     venv: Literal["prepend", "append"] | None = None,
     index_url: str | None = None,
+    pex_root: Path | None = None,
+    layout: Literal["zipapp", "packed", "loose"] | None = None,
+    compile_bytecode: bool | None = None,
     task_name: str | None = None,
     project: Project | None = None,
 ) -> PexBuildTask:
@@ -168,6 +260,9 @@ def pex_build(
         and existing_task.interpreter_constraint.get() == interpreter_constraint
         and existing_task.venv.get() == venv
         and existing_task.index_url.get() == index_url
+        and existing_task.pex_root.get() == pex_root
+        and existing_task.layout.get() == layout
+        and existing_task.compile_bytecode.get() == compile_bytecode
     ):
         return existing_task
 
@@ -179,6 +274,9 @@ def pex_build(
     task.interpreter_constraint = interpreter_constraint
     task.venv = venv
     task.index_url = index_url
+    task.pex_root = pex_root
+    task.layout = layout
+    task.compile_bytecode = compile_bytecode
     return task
 
 
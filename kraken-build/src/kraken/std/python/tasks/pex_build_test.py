@@ -1,5 +1,6 @@
 import logging
 import subprocess
+import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from textwrap import dedent
@@ -49,3 +50,29 @@ def test__PexBuildTask__install_isort(kraken_project: Project) -> None:
             from kraken.core import Project, Task
             """
         )
+
+
+def test__PexBuildTask__failed_build_reports_output_file_and_removes_temporary_file(
+    kraken_project: Project, tmp_path: Path
+) -> None:
+    # A fake pex that writes part of the output before it fails.
+    pex = tmp_path / "pex"
+    pex.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "open(sys.argv[sys.argv.index('--output-file') + 1], 'w').write('partial')\n"
+        "sys.exit(1)\n"
+    )
+    pex.chmod(0o755)
+
+    task = kraken_project.task("broken.install", PexBuildTask)
+    task.binary_name = "broken"
+    task.requirements = ["broken"]
+    task.pex_binary = pex
+    task.prepare()
+    status = task.execute()
+
+    output_file = task.output_file.get()
+    assert status is not None and status.is_failed()
+    assert str(output_file) in (status.message or "")
+    assert [p.name for p in output_file.parent.iterdir()] == [output_file.name + ".lock"]
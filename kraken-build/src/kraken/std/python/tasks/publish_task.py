@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import subprocess
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from kraken.core import Project, Property, Task, TaskRelationship
@@ -21,6 +23,11 @@ class PublishTask(Task):
     distributions: Property[list[Path]]
     skip_existing: Property[bool] = Property.default(False)
     interactive: Property[bool] = Property.default(True)
+
+    #: The maximum number of distributions to upload in parallel. Each distribution is uploaded by a separate
+    #: Twine process if this is greater than 1, which implies non-interactive mode.
+    max_upload_concurrency: Property[int] = Property.default(1)
+
     dependencies: list[Task]
 
     def __init__(self, name: str, project: Project) -> None:
@@ -31,7 +38,7 @@ class PublishTask(Task):
         yield from (TaskRelationship(task, True, False) for task in self.dependencies)
         yield from super().get_relationships()
 
-    def execute(self) -> TaskStatus:
+    def _upload(self, distributions: Sequence[Path], interactive: bool) -> TaskStatus:
         credentials = self.index_credentials.get()
         repository_url = self.index_upload_url.get().rstrip("/") + "/"
         command = [
@@ -40,25 +47,37 @@ class PublishTask(Task):
             "--repository-url",
             repository_url,
             "--verbose",
-            *[str(x.absolute()) for x in self.distributions.get()],
+            *[str(x.absolute()) for x in distributions],
         ]
-        if credentials:
-            command += [
-                "--username",
-                credentials[0],
-                "--password",
-                credentials[1],
-            ]
-        if not self.interactive.get():
+        if not interactive:
             command.append("--non-interactive")
         if self.skip_existing.get():
             command.append("--skip-existing")
 
-        safe_command = [x.replace(credentials[1], "MASKED") for x in command] if credentials else command
-        self.logger.info("$ %s", safe_command)
+        # NOTE: We pass the credentials via the environment so they don't show up in the process list or logs.
+        env = None
+        if credentials:
+            env = {**os.environ, "TWINE_USERNAME": credentials[0], "TWINE_PASSWORD": credentials[1]}
+
+        self.logger.info("$ %s", command)
+
+        returncode = subprocess.call(command, cwd=self.project.directory, env=env)
+        return TaskStatus.from_exit_code(command, returncode)
+
+    def execute(self) -> TaskStatus:
+        distributions = self.distributions.get()
+        max_workers = min(self.max_upload_concurrency.get(), len(distributions))
+
+        if max_workers <= 1:
+            return self._upload(distributions, self.interactive.get())
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            statuses = list(executor.map(lambda dist: self._upload([dist], False), distributions))
 
-        returncode = subprocess.call(command, cwd=self.project.directory)
-        return TaskStatus.from_exit_code(safe_command, returncode)
+        failed = [status for status in statuses if status.is_failed()]
+        if failed:
+            return TaskStatus.failed("; ".join(status.message or "" for status in failed))
+        return TaskStatus.succeeded()
 
 
 def publish(
@@ -67,6 +86,7 @@ def publish(
     distributions: list[Path] | Property[list[Path]],
     skip_existing: bool = False,
     interactive: bool = True,
+    max_upload_concurrency: int = 1,
     name: str = "python.publish",
     group: str | None = "publish",
     project: Project | None = None,
@@ -92,5 +112,6 @@ def publish(
     task.distributions = distributions
     task.skip_existing = skip_existing
     task.interactive = interactive
+    task.max_upload_concurrency = max_upload_concurrency
     task.depends_on(*(after or []))
     return task
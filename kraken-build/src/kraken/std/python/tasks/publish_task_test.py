@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+
+from kraken.core import Project
+from kraken.std.python.tasks.publish_task import PublishTask
+
+
+def test__PublishTask__uploads_distributions_concurrently(kraken_project: Project, tmp_path: Path) -> None:
+    log_dir = tmp_path / "log"
+    log_dir.mkdir()
+    twine = tmp_path / "twine"
+    twine.write_text(
+        f"#!{sys.executable}\n"
+        "import os, sys, uuid\n"
+        "args = sys.argv[1:] + [os.environ['TWINE_PASSWORD']]\n"
+        f"open({str(log_dir)!r} + '/' + uuid.uuid4().hex, 'w').write(' '.join(args))\n"
+    )
+    twine.chmod(0o755)
+
+    task = kraken_project.task("python.publish", PublishTask)
+    task.twine_bin = twine
+    task.index_upload_url = "https://example.org/upload"
+    task.index_credentials = ("user", "secret")
+    task.distributions = [tmp_path / "pkg-1.0.0.tar.gz", tmp_path / "pkg-1.0.0-py3-none-any.whl"]
+    task.max_upload_concurrency = 2
+    kraken_project.context.execute([task])
+
+    invocations = sorted(f.read_text() for f in log_dir.iterdir())
+    assert len(invocations) == 2
+    assert all("--non-interactive" in args for args in invocations)
+    assert all("--password" not in args and args.endswith(" secret") for args in invocations)
+    assert "pkg-1.0.0-py3-none-any.whl" in invocations[0] and "pkg-1.0.0.tar.gz" not in invocations[0]
+    assert "pkg-1.0.0.tar.gz" in invocations[1] and "pkg-1.0.0-py3-none-any.whl" not in invocations[1]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
+from collections.abc import Sequence
 from pathlib import Path
 
 from kraken.common.supplier import Supplier
@@ -18,8 +19,8 @@ class PyclnTask(EnvironmentAwareDispatchTask):
     pycln_bin: Property[str] = Property.default("pycln")
     check_only: Property[bool] = Property.default(False)
     config_file: Property[Path]
-    additional_args: Property[list[str]] = Property.default_factory(list)
-    additional_files: Property[list[Path]] = Property.default_factory(list)
+    additional_args: Property[Sequence[str]] = Property.default(())
+    additional_files: Property[Sequence[Path]] = Property.default(())
 
     # EnvironmentAwareDispatchTask
 
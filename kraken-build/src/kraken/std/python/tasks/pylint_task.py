@@ -16,7 +16,7 @@ class PylintTask(EnvironmentAwareDispatchTask):
 
     pylint_bin: Property[str] = Property.default("pylint")
     config_file: Property[Path]
-    additional_args: Property[Sequence[str]] = Property.default_factory(list)
+    additional_args: Property[Sequence[str]] = Property.default(())
 
     # EnvironmentAwareDispatchTask
 
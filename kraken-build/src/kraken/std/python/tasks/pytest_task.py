@@ -32,7 +32,7 @@ class PytestTask(EnvironmentAwareDispatchTask):
 
     tests_dir: Property[Path]
     include_dirs: Property[Sequence[Path]] = Property.default(())
-    ignore_dirs: Property[Sequence[Path]] = Property.default_factory(list)
+    ignore_dirs: Property[Sequence[Path]] = Property.default(())
     allow_no_tests: Property[bool] = Property.default(False)
     doctest_modules: Property[bool] = Property.default(True)
     marker: Property[str]
@@ -49,26 +49,28 @@ class PytestTask(EnvironmentAwareDispatchTask):
         if not tests_dir:
             print("error: no test directory configured and none could be detected")
             return TaskStatus.failed("no test directory configured and none could be detected")
+        project_dir = self.project.directory
+        source_dir = project_dir / self.settings.source_directory
         command = [
             "pytest",
             "-vv",
-            str(self.project.directory / self.settings.source_directory),
-            str(self.project.directory / tests_dir),
-            *[str(self.project.directory / path) for path in self.include_dirs.get()],
+            str(source_dir),
+            str(project_dir / tests_dir),
+            *[str(project_dir / path) for path in self.include_dirs.get()],
         ]
-        command += flatten(["--ignore", str(self.project.directory / path)] for path in self.ignore_dirs.get())
+        command += flatten(["--ignore", str(project_dir / path)] for path in self.ignore_dirs.get())
         command += ["--log-cli-level", "INFO"]
-        if self.coverage.is_filled():
-            coverage_file = f"coverage{self.coverage.get().get_suffix()}"
+        if (coverage := self.coverage.get_or(None)) is not None:
+            coverage_file = f"coverage{coverage.get_suffix()}"
             command += [
                 "--cov-report",
-                f"{self.coverage.get().get_format()}:{str(self.project.build_directory / coverage_file)}",
+                f"{coverage.get_format()}:{str(self.project.build_directory / coverage_file)}",
                 "--cov-report",
                 "term",
-                f"--cov={str(self.project.directory / self.settings.source_directory)}",
+                f"--cov={source_dir}",
             ]
-        if self.marker.is_filled():
-            command += ["-m", self.marker.get()]
+        if (marker := self.marker.get_or(None)) is not None:
+            command += ["-m", marker]
         if self.doctest_modules.get():
             command += ["--doctest-modules"]
         command += shlex.split(os.getenv("PYTEST_FLAGS", ""))
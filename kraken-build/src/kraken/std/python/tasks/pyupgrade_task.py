@@ -1,9 +1,19 @@
 from __future__ import annotations
 
 import dataclasses
-from collections.abc import Collection, Iterable, Sequence
+import filecmp
+import fnmatch
+import json
+import os
+import re
+import shlex
+import shutil
+import subprocess
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from difflib import unified_diff
-from pathlib import Path
+from itertools import chain
+from pathlib import Path, PurePath
 from sys import stdout
 from tempfile import TemporaryDirectory
 
@@ -14,6 +24,9 @@ from kraken.std.python.tasks.pex_build_task import pex_build
 from .. import python_settings
 from .base_task import EnvironmentAwareDispatchTask
 
+#: Prints the version of pyupgrade that is installed for the Python interpreter that runs it.
+_PYUPGRADE_VERSION_SCRIPT = "import importlib.metadata as m; print(m.version('pyupgrade'))"
+
 
 class PyUpgradeTask(EnvironmentAwareDispatchTask):
     description = "Upgrades to newer Python syntax sugars with pyupgrade."
@@ -21,7 +34,7 @@ class PyUpgradeTask(EnvironmentAwareDispatchTask):
 
     pyupgrade_bin: Property[str] = Property.default("pyupgrade")
     keep_runtime_typing: Property[bool] = Property.default(False)
-    additional_files: Property[Sequence[Path]] = Property.default_factory(list)
+    additional_files: Property[Sequence[Path]] = Property.default(())
     python_version: Property[str]
 
     # EnvironmentAwareDispatchTask
@@ -42,45 +55,211 @@ class PyUpgradeCheckTask(PyUpgradeTask):
     python_dependencies = ["pyupgrade"]
 
     keep_runtime_typing: Property[bool] = Property.default(False)
-    additional_files: Property[Sequence[Path]] = Property.default_factory(list)
+    additional_files: Property[Sequence[Path]] = Property.default(())
     python_version: Property[str]
 
+    #: Only check files that changed (by modification time and size) since the last successful check. All files
+    #: are checked again if the options or the pyupgrade version changed, or if the version can not be determined.
+    incremental: Property[bool] = Property.default(False)
+
+    def _get_pyupgrade_version(self) -> str | None:
+        """Returns the version of pyupgrade that the check runs with, or #None if it can not be determined. A PEX is
+        asked directly, otherwise we ask the interpreter from the shebang of the `pyupgrade` script."""
+
+        env = os.environ.copy()
+        self.activate_environment(env)
+        program = self.resolve_program(self.pyupgrade_bin.get(), env)
+        if program is None:
+            self.logger.debug("Could not find `%s` to determine the pyupgrade version", self.pyupgrade_bin.get())
+            return None
+
+        if program.endswith(".pex"):
+            env["PEX_INTERPRETER"] = "1"
+            interpreter = [program]
+        else:
+            try:
+                with open(program, "rb") as fp:
+                    first_line = fp.readline()
+            except OSError as exc:
+                self.logger.debug("Could not read %s to determine the pyupgrade version: %s", program, exc)
+                return None
+            if not first_line.startswith(b"#!"):
+                # E.g. the `.exe` launchers that pip creates on Windows.
+                self.logger.debug("Can not determine the pyupgrade version, %s is not a script with a shebang", program)
+                return None
+            interpreter = shlex.split(first_line[2:].decode(errors="replace"))
+
+        try:
+            result = subprocess.run(
+                [*interpreter, "-c", _PYUPGRADE_VERSION_SCRIPT],
+                cwd=self.project.directory,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as exc:
+            self.logger.debug("Could not determine the pyupgrade version of %s: %s", program, exc)
+            return None
+        return result.stdout.decode().strip() or None
+
+    def _get_fingerprints_file(self) -> Path:
+        return self.project.build_directory / f"{self.name}.fingerprints.json"
+
+    def _load_fingerprints(self, options: list[str]) -> dict[str, list[int]]:
+        try:
+            data = json.loads(self._get_fingerprints_file().read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("options") != options:
+            return {}
+        return data.get("files") or {}
+
+    def _save_fingerprints(self, options: list[str], fingerprints: dict[str, list[int]]) -> None:
+        path = self._get_fingerprints_file()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"options": options, "files": fingerprints}))
+
     def execute(self) -> TaskStatus:
+        files = list(self.additional_files.get())
+        if not self.incremental.get():
+            return self._check(files)
+
+        version = self._get_pyupgrade_version()
+        if version is None:
+            self.logger.warning("Could not determine the pyupgrade version, checking all files.")
+            return self._check(files)
+
+        options = [f"pyupgrade=={version}", *self.run_pyupgrade((), ())]
+        fingerprints = {str(f): _fingerprint(f) for f in files}
+        previous = self._load_fingerprints(options)
+        changed_files = [f for f in files if previous.get(str(f)) != fingerprints[str(f)]]
+        if not changed_files:
+            return TaskStatus.up_to_date("no files changed since the last check")
+
+        result = self._check(changed_files)
+        if result.is_succeeded():
+            self._save_fingerprints(options, fingerprints)
+        return result
+
+    def _check(self, old_files: list[Path]) -> TaskStatus:
         # We copy the file because there is no way to make pyupgrade not edit the files
         old_dir = self.settings.project.directory.resolve()
-        new_file_for_old_file = {}
-        with TemporaryDirectory() as new_dir:
-            for file in self.additional_files.get():
+        with TemporaryDirectory() as new_dir, ThreadPoolExecutor() as executor:
+
+            def copy_file(file: Path) -> Path:
                 new_file = new_dir / file.resolve().relative_to(old_dir)
                 new_file.parent.mkdir(parents=True, exist_ok=True)
-                new_file.write_bytes(file.read_bytes())
-                new_file_for_old_file[file] = new_file
-            self._files = new_file_for_old_file.values()
+                shutil.copyfile(file, new_file)
+                return new_file
+
+            # NOTE: Copying and diffing are I/O bound, so we spread them over a thread pool for large code bases.
+            new_files = list(executor.map(copy_file, old_files))
+            self._files = new_files
 
             result = super().execute()
             if not result.is_failed():
                 return result  # nothing more to do
 
-            # We print a diff
-            for old_file, new_file in new_file_for_old_file.items():
-                old_content = old_file.read_text()
-                new_content = new_file.read_text()
-                if old_content != new_content:
-                    stdout.writelines(
-                        unified_diff(
-                            old_content.splitlines(keepends=True),
-                            new_content.splitlines(keepends=True),
-                            fromfile=str(old_file),
-                            tofile=str(old_file),
-                            n=5,
-                        )
-                    )
+            # We print a diff, in one go to avoid lots of small writes to the terminal.
+            stdout.write("".join(chain.from_iterable(executor.map(_diff_file, old_files, new_files))))
+            stdout.flush()
             return result
 
     def get_execute_command(self) -> list[str]:
         return self.run_pyupgrade(self._files, ())
 
 
+def _fingerprint(file: Path) -> list[int]:
+    st = os.stat(file)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _diff_file(old_file: Path, new_file: Path) -> list[str]:
+    """Returns the unified diff lines between *old_file* and *new_file*, labelled with the name of the *old_file*."""
+
+    # Most files are left untouched, so we avoid decoding and splitting them if the bytes are identical.
+    if filecmp.cmp(old_file, new_file, shallow=False):
+        return []
+
+    old_content = old_file.read_text()
+    new_content = new_file.read_text()
+    if old_content == new_content:
+        return []
+    return list(
+        unified_diff(
+            old_content.splitlines(keepends=True),
+            new_content.splitlines(keepends=True),
+            fromfile=str(old_file),
+            tofile=str(old_file),
+            n=5,
+        )
+    )
+
+
+class _PathPattern:
+    """A precompiled equivalent of :meth:`PurePath.match`, which would otherwise parse the pattern again for every
+    path it is matched against."""
+
+    def __init__(self, pattern: str) -> None:
+        pattern_path = PurePath(pattern)
+        if not pattern_path.parts:
+            raise ValueError("empty pattern")
+        flags = 0 if os.path.normcase("A") == "A" else re.IGNORECASE
+        self._anchored = bool(pattern_path.anchor)
+        self._parts = [re.compile(fnmatch.translate(part), flags) for part in pattern_path.parts]
+
+    def match(self, path: PurePath) -> bool:
+        parts = path.parts
+        if len(parts) < len(self._parts) or (self._anchored and len(parts) != len(self._parts)):
+            return False
+        return all(regex.match(part) for regex, part in zip(self._parts, parts[len(parts) - len(self._parts) :]))
+
+
+def _iter_python_files(directory: str) -> Iterator[str]:
+    """Recursively yields the paths of all `.py` files in *directory*. Symlinked directories are not followed.
+
+    This uses :func:`os.scandir` directly because :meth:`Path.glob` is comparatively slow on large directory trees."""
+
+    stack = [directory]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif os.path.normcase(entry.name).endswith(".py") and entry.is_file():
+                    yield entry.path
+
+
+def _discover_python_files(
+    directories: Iterable[Path], exclude: Iterable[Path], exclude_patterns: Collection[str]
+) -> list[Path]:
+    """Find all Python files in the given *directories*, except for those that are in (or are) any of the *exclude*
+    paths or that match any of the *exclude_patterns*."""
+
+    files = {Path(os.path.realpath(f)) for p in directories for f in _iter_python_files(os.fspath(p))}
+
+    # NOTE: Comparing strings is a lot cheaper than Path.is_relative_to(), which matters for large code bases.
+    exclude_paths = {str(e.resolve()) for e in exclude}
+    exclude_prefixes = tuple(e.rstrip(os.sep) + os.sep for e in exclude_paths)
+    patterns = [_PathPattern(p) for p in exclude_patterns]
+
+    result = []
+    for f in files:
+        f_str = str(f)
+        if f_str in exclude_paths or f_str.startswith(exclude_prefixes):
+            continue
+        if any(p.match(f) for p in patterns):
+            continue
+        result.append(f)
+    return result
+
+
 @dataclasses.dataclass
 class PyUpgradeTasks:
     check: PyUpgradeTask
@@ -97,10 +276,12 @@ def pyupgrade(
     python_version: str = "3",
     additional_files: Sequence[Path] = (),
     version_spec: str | None = None,
+    incremental: bool = False,
 ) -> PyUpgradeTasks:
     """
     :param version_spec: If specified, the pyupgrade tool will be installed as a PEX and does not need to be installed
         into the Python project's virtual env.
+    :param incremental: If enabled, the check task only checks files that changed since its last successful run.
     """
 
     project = project or Project.current()
@@ -119,19 +300,14 @@ def pyupgrade(
     test_directory = settings.get_tests_directory()
     if test_directory is not None:
         directories.append(project.directory / test_directory)
-    files = {f.resolve() for p in directories for f in Path(p).glob("**/*.py")}
-    exclude = [e.resolve() for e in exclude]
-    filtered_files = [
-        f
-        for f in files
-        if not any(f.is_relative_to(i) for i in exclude) and not any(f.match(p) for p in exclude_patterns)
-    ]
+    filtered_files = tuple(_discover_python_files(directories, exclude, exclude_patterns))
 
     check_task = project.task(f"{name}.check", PyUpgradeCheckTask, group="lint")
     check_task.pyupgrade_bin = pyupgrade_bin
     check_task.additional_files = filtered_files
     check_task.keep_runtime_typing = keep_runtime_typing
     check_task.python_version = python_version
+    check_task.incremental = incremental
 
     format_task = project.task(name, PyUpgradeTask, group="fmt")
     format_task.pyupgrade_bin = pyupgrade_bin
@@ -0,0 +1,112 @@
+import logging
+import sys
+from pathlib import Path, PurePosixPath
+
+import pytest
+
+from kraken.core import Project
+from kraken.std.python.tasks.pyupgrade_task import PyUpgradeCheckTask, _discover_python_files, _PathPattern
+
+
+def test__discover_python_files__applies_excludes(tmp_path: Path) -> None:
+    for name in [
+        "src/pkg/__init__.py",
+        "src/pkg/api_pb2.py",
+        "src/pkg/vendor/lib.py",
+        "src/pkg/skipped.py",
+        "src/pkg/README.md",
+        "tests/test_pkg.py",
+        "tests/data/sample.py",
+    ]:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).touch()
+
+    files = _discover_python_files(
+        [tmp_path / "src", tmp_path / "tests"],
+        exclude=[tmp_path / "src/pkg/vendor", tmp_path / "src/pkg/skipped.py"],
+        exclude_patterns=["*_pb2.py", "data/*.py"],
+    )
+
+    assert sorted(f.relative_to(tmp_path.resolve()).as_posix() for f in files) == [
+        "src/pkg/__init__.py",
+        "tests/test_pkg.py",
+    ]
+
+
+@pytest.mark.parametrize("pattern", ["*.py", "tests/*.py", "/a/*/c.py", "/a/b/c.py", "*/*/*.py", "/*.py", "[ab]/*.py"])
+@pytest.mark.parametrize("path", ["/a/b/c.py", "/a/tests/x.py", "c.py", "a/b/c.py", "/a/b/c.pyi"])
+def test__PathPattern__matches_like_PurePath_match(pattern: str, path: str) -> None:
+    assert _PathPattern(pattern).match(PurePosixPath(path)) == PurePosixPath(path).match(pattern)
+
+
+@pytest.fixture
+def incremental_check(kraken_project: Project, monkeypatch: pytest.MonkeyPatch) -> PyUpgradeCheckTask:
+    """A check task with a fake pyupgrade that logs the files it was called with and fails for files with `OLD`."""
+
+    pyupgrade = kraken_project.directory / "pyupgrade"
+    pyupgrade.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "files = [f for f in sys.argv[1:] if not f.startswith('-')]\n"
+        f"open({str(kraken_project.directory / 'calls.log')!r}, 'a').write(' '.join(sorted(files)) + '\\n')\n"
+        "sys.exit(any('OLD' in open(f).read() for f in files))\n"
+    )
+    pyupgrade.chmod(0o755)
+    for name in ("a.py", "b.py"):
+        (kraken_project.directory / name).write_text("x = 1\n")
+
+    monkeypatch.setattr(PyUpgradeCheckTask, "_get_pyupgrade_version", lambda self: "1.0.0")
+    task = kraken_project.task("python.pyupgrade.check", PyUpgradeCheckTask)
+    task.pyupgrade_bin = str(pyupgrade)
+    task.additional_files = [kraken_project.directory / "a.py", kraken_project.directory / "b.py"]
+    task.incremental = True
+    return task
+
+
+def _checked_files(task: PyUpgradeCheckTask) -> list[list[str]]:
+    log = (task.project.directory / "calls.log").read_text().splitlines()
+    return [[Path(f).name for f in line.split()] for line in log]
+
+
+def test__PyUpgradeCheckTask__incremental_second_run_is_up_to_date(incremental_check: PyUpgradeCheckTask) -> None:
+    assert incremental_check.execute().is_succeeded()
+    assert incremental_check.execute().is_up_to_date()
+    assert _checked_files(incremental_check) == [["a.py", "b.py"]]
+
+
+def test__PyUpgradeCheckTask__incremental_rechecks_only_modified_files(
+    incremental_check: PyUpgradeCheckTask, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert incremental_check.execute().is_succeeded()
+    (incremental_check.project.directory / "b.py").write_text("x = 2  # changed\n")
+    assert incremental_check.execute().is_succeeded()
+    assert _checked_files(incremental_check) == [["a.py", "b.py"], ["b.py"]]
+
+    # Upgrading pyupgrade invalidates the state of all files.
+    monkeypatch.setattr(PyUpgradeCheckTask, "_get_pyupgrade_version", lambda self: "2.0.0")
+    assert incremental_check.execute().is_succeeded()
+    assert _checked_files(incremental_check)[-1] == ["a.py", "b.py"]
+
+
+def test__PyUpgradeCheckTask__incremental_does_not_save_state_after_failed_check(
+    incremental_check: PyUpgradeCheckTask,
+) -> None:
+    (incremental_check.project.directory / "a.py").write_text("x = 'OLD'\n")
+    assert incremental_check.execute().is_failed()
+    assert not incremental_check._get_fingerprints_file().exists()
+    assert incremental_check.execute().is_failed()
+    assert _checked_files(incremental_check) == [["a.py", "b.py"], ["a.py", "b.py"]]
+
+
+def test__PyUpgradeCheckTask__logs_why_the_pyupgrade_version_is_unknown(
+    kraken_project: Project, caplog: pytest.LogCaptureFixture
+) -> None:
+    launcher = kraken_project.directory / "pyupgrade.exe"
+    launcher.write_bytes(b"MZ\x90\x00")
+    launcher.chmod(0o755)
+
+    task = kraken_project.task("python.pyupgrade.check", PyUpgradeCheckTask)
+    task.pyupgrade_bin = str(launcher)
+    with caplog.at_level(logging.DEBUG):
+        assert task._get_pyupgrade_version() is None
+    assert "is not a script with a shebang" in caplog.text
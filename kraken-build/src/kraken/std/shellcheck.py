@@ -3,7 +3,7 @@ import shutil
 import subprocess
 import sys
 from collections.abc import Sequence
-from hashlib import md5
+from hashlib import blake2b
 from pathlib import Path
 from posixpath import basename
 from shutil import copyfileobj
@@ -11,7 +11,7 @@ from tarfile import open as TarFile
 
 from requests import get
 
-from kraken.common import not_none
+from kraken.common import atomic_replace, not_none
 from kraken.core import Property, Task, TaskStatus
 
 
@@ -45,28 +45,24 @@ class ShellcheckTask(Task):
         return url
 
     def install_shellcheck_from_url(self, url: str) -> str:
-        md5sum = md5(url.encode()).hexdigest()
-        store_path = self.project.context.build_directory / ".store" / md5sum
-        archive_path = store_path / basename(url)
+        url_hash = blake2b(url.encode(), digest_size=16).hexdigest()
+        store_path = self.project.context.build_directory / ".store" / url_hash
         bin_path = store_path / "shellcheck"
 
         if not bin_path.exists():
-            if not archive_path.exists():
-                store_path.mkdir(parents=True, exist_ok=True)
-                self.logger.info("Downloading %s ...", url)
-                try:
-                    with archive_path.open("wb") as fp:
-                        for chunk in get(url, stream=True).iter_content():
-                            fp.write(chunk)
-                except Exception:
-                    archive_path.unlink()
-                    raise
-            self.logger.info("Extracting `%s` from %s ...", bin_path.name, archive_path)
-            with TarFile(archive_path, "r") as tfp:
-                member = next(m for m in tfp.getmembers() if basename(m.name) == "shellcheck")
-                with not_none(tfp.extractfile(member)) as src, bin_path.open("wb") as dst:
-                    copyfileobj(src, dst)
-                bin_path.chmod(0o777)
+            store_path.mkdir(parents=True, exist_ok=True)
+            self.logger.info("Downloading and extracting `%s` from %s ...", bin_path.name, url)
+            # Decompress the archive as it arrives instead of saving it to disk and reading it back.
+            with atomic_replace(bin_path) as tmp_path, get(url, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with TarFile(fileobj=response.raw, mode="r|*") as tfp:
+                    member = next((m for m in tfp if basename(m.name) == "shellcheck"), None)
+                    if member is None:
+                        raise RuntimeError(f"`{bin_path.name}` not found in archive {url}")
+                    with not_none(tfp.extractfile(member)) as src, tmp_path.open("wb") as dst:
+                        copyfileobj(src, dst, 1 << 20)
+                tmp_path.chmod(0o777)
 
         return str(bin_path.absolute())
 
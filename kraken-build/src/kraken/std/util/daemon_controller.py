@@ -2,6 +2,7 @@ import errno
 import json
 import logging
 import os
+import select
 import signal
 import subprocess
 import sys
@@ -11,6 +12,8 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import IO, Any, Literal
 
+from kraken.common import atomic_replace
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,21 +31,49 @@ def process_exists(pid: int) -> bool:
     return True
 
 
+def _wait_pidfd(pid: int, timeout: float) -> bool | None:
+    """Wait for the process of *pid* to exit using a pidfd, which becomes readable when the process exits. Returns
+    #True if the process exited within the timeout period, #False if it did not, or #None if pidfds are not
+    supported on this platform, in which case the caller has to fall back to polling."""
+
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        fd = os.pidfd_open(pid)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        return None
+    try:
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        return bool(poller.poll(max(timeout, 0.0) * 1000))
+    finally:
+        os.close(fd)
+
+
 def wait_for_child_process(pid: int, timeout: float, interval: float = 0.1) -> int | None:
     """Wait for the process of *pid* to exit and return the exit code. This only works for child processes."""
 
     tstart = time.perf_counter()
-    while (time.perf_counter() - tstart) < timeout:
+    if _wait_pidfd(pid, timeout) is False:
+        return None
+    while True:
         (pid_returned, status) = os.waitpid(pid, os.WNOHANG)
         if pid_returned != 0:
             return os.waitstatus_to_exitcode(status)
+        if (time.perf_counter() - tstart) >= timeout:
+            return None
         time.sleep(interval)
-    return None
 
 
 def wait_for_process(pid: int, timeout: float, interval: float = 0.1) -> bool:
     """Wait for a process to exit. Returns True if the process exited within the timeout period."""
 
+    exited = _wait_pidfd(pid, timeout)
+    if exited is not None:
+        return exited
+
     tstart = time.perf_counter()
     while (time.perf_counter() - tstart) < timeout:
         if not process_exists(pid):
@@ -139,8 +170,24 @@ class DaemonController:
     def __init__(self, name: str, state_file: Path) -> None:
         self.name = name
         self.state_file = state_file
+        self._state_cache: tuple[tuple[int, int, int], DaemonController.State | None] | None = None
 
     def load_state(self) -> State | None:
+        try:
+            st = self.state_file.stat()
+        except FileNotFoundError:
+            return None
+
+        # Repeated liveness checks usually find the state file unchanged, so we can skip parsing it again.
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if self._state_cache is not None and self._state_cache[0] == key:
+            return self._state_cache[1]
+
+        state = self._parse_state()
+        self._state_cache = (key, state)
+        return state
+
+    def _parse_state(self) -> State | None:
         try:
             data = json.loads(self.state_file.read_text())
         except FileNotFoundError:
@@ -167,9 +214,13 @@ class DaemonController:
             return None
 
     def save_state(self, state: State) -> None:
-        self.state_file.write_text(json.dumps(asdict(state)))
+        self._state_cache = None
+        # Write to a temporary file first so that concurrent readers never observe a partially written state.
+        with atomic_replace(self.state_file) as tmp_file:
+            tmp_file.write_text(json.dumps(asdict(state)))
 
     def remove_state(self) -> None:
+        self._state_cache = None
         try:
             self.state_file.unlink()
         except FileNotFoundError:
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from kraken.std.util.daemon_controller import DaemonController, wait_for_child_process, wait_for_process
+
+
+def test__wait_for_child_process__returns_exit_code() -> None:
+    proc = subprocess.Popen([sys.executable, "-c", "import sys; sys.exit(3)"])
+    assert wait_for_child_process(proc.pid, 10.0) == 3
+    proc.returncode = 3  # Already reaped, keep Popen from waiting on it again.
+
+
+def test__wait_for_child_process__returns_none_on_timeout() -> None:
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(10)"])
+    try:
+        tstart = time.perf_counter()
+        assert wait_for_child_process(proc.pid, 0.2) is None
+        assert time.perf_counter() - tstart < 5.0
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test__wait_for_process__detects_exit_and_timeout() -> None:
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(10)"])
+    try:
+        assert wait_for_process(proc.pid, 0.2) is False
+    finally:
+        proc.kill()
+        proc.wait()
+    assert wait_for_process(proc.pid, 1.0) is True
+
+
+def test__DaemonController__load_state_reuses_parsed_state_until_file_changes(tmp_path: Path) -> None:
+    controller = DaemonController("test", tmp_path / "state.json")
+    assert controller.load_state() is None
+
+    controller.save_state(DaemonController.State(["sleep"], "/", {}, 42, 0.0))
+    state = controller.load_state()
+    assert state is not None and state.pid == 42
+    assert controller.load_state() is state
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+    # Another process rewrites the state file behind our back.
+    DaemonController("other", controller.state_file).save_state(DaemonController.State(["sleep"], "/", {}, 1234, 0.0))
+    state = controller.load_state()
+    assert state is not None and state.pid == 1234
+
+    controller.remove_state()
+    assert controller.load_state() is None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from kraken.common.path import try_relative_to
@@ -10,6 +11,22 @@ from kraken.core import Project, Property, Task, TaskStatus
 from .check_file_contents_task import CheckFileContentsTask
 
 DEFAULT_ENCODING = "utf-8"
+_CHUNK_SIZE = 1 << 20
+
+
+def _file_content_equals(path: Path, content: bytes) -> bool:
+    """Compare the contents of *path* with *content* in chunks, without loading the whole file into memory."""
+
+    view = memoryview(content)
+    offset = 0
+    with path.open("rb") as fp:
+        if os.fstat(fp.fileno()).st_size != len(content):
+            return False
+        while chunk := fp.read(_CHUNK_SIZE):
+            if view[offset : offset + len(chunk)] != chunk:
+                return False
+            offset += len(chunk)
+    return offset == len(content)
 
 
 class RenderFileTask(Task):
@@ -49,7 +66,7 @@ class RenderFileTask(Task):
 
     def prepare(self) -> TaskStatus:
         file = self.file.get()
-        if file.is_file() and file.read_bytes() == as_bytes(self.content.get(), self.encoding.get()):
+        if file.is_file() and _file_content_equals(file, as_bytes(self.content.get(), self.encoding.get())):
             return TaskStatus.up_to_date(f'"{try_relative_to(file)}" is up to date')
         return TaskStatus.pending()
 
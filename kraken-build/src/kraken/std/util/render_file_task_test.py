@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import pytest
+
+from kraken.std.util import render_file_task
+from kraken.std.util.render_file_task import _file_content_equals
+
+
+@pytest.mark.parametrize(
+    "file_content,content,expected",
+    [
+        (b"", b"", True),
+        (b"abcdefgh", b"abcdefgh", True),
+        (b"abcdefgh", b"abcdefgx", False),
+        (b"abcdefgh", b"abcdefghi", False),
+        (b"abcdefghi", b"abcdefgh", False),
+    ],
+)
+def test__file_content_equals(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, file_content: bytes, content: bytes, expected: bool
+) -> None:
+    monkeypatch.setattr(render_file_task, "_CHUNK_SIZE", 3)
+    path = tmp_path / "file.txt"
+    path.write_bytes(file_content)
+    assert _file_content_equals(path, content) is expected
+
+
+def test__file_content_equals__does_not_read_file_on_size_mismatch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"abc")
+    monkeypatch.setattr(render_file_task, "_CHUNK_SIZE", 0)  # Reading would return nothing and compare equal.
+    assert _file_content_equals(path, b"") is False